@@ -59,91 +59,72 @@ int CalendarDisplay::getFirstDayOfWeek(int year, int month) {
   return dayOfWeek;
 }
 
-bool CalendarDisplay::hasDayActivity(int day, int* activityDays, int activityCount) {
-  for (int i = 0; i < activityCount; i++) {
-    if (activityDays[i] == day) {
-      return true;
-    }
-  }
-  return false;
-}
-
-void CalendarDisplay::printCalendar(int year, int month, int* activityDays, int activityCount) {
+void CalendarDisplay::printCalendar(Print& output, int year, int month, uint32_t activityDays) {
   int daysInMonth = getDaysInMonth(year, month);
   int firstDay = getFirstDayOfWeek(year, month);
   
   // Print header
-  Serial.println();
-  Serial.print("   ");
-  Serial.print(getMonthName(month));
-  Serial.print(" ");
-  Serial.println(year);
-  Serial.println("Su Mo Tu We Th Fr Sa");
-  
-  // Print leading spaces for first week
+  output.printf("\n   %s %d\n", getMonthName(month), year);
+  output.println("Su Mo Tu We Th Fr Sa");
+  
+  // Build each week in a line buffer and write it in one call
+  // (3 chars per day, 7 days, plus terminator)
+  char line[7 * 3 + 1];
+  int pos = 0;
+  
+  // Leading spaces for first week
   for (int i = 0; i < firstDay; i++) {
-    Serial.print("   ");
+    line[pos++] = ' ';
+    line[pos++] = ' ';
+    line[pos++] = ' ';
   }
   
-  // Print calendar days
+  // Calendar days
   int currentDayOfWeek = firstDay;
   
   for (int day = 1; day <= daysInMonth; day++) {
-    Serial.print(" ");
-    
-    // Print X for activity, . for no activity
-    if (hasDayActivity(day, activityDays, activityCount)) {
-      Serial.print("X");
-    } else {
-      Serial.print(".");
-    }
-    
-    Serial.print(" ");
+    // X for activity, . for no activity
+    line[pos++] = ' ';
+    line[pos++] = (activityDays & (1UL << day)) ? 'X' : '.';
+    line[pos++] = ' ';
     
     currentDayOfWeek++;
     
     // New line after Saturday
     if (currentDayOfWeek > 6) {
-      Serial.println();
+      line[pos] = '\0';
+      output.println(line);
+      pos = 0;
       currentDayOfWeek = 0;
     }
   }
   
-  // Final newline if needed
-  if (currentDayOfWeek != 0) {
-    Serial.println();
+  // Flush a partial final week
+  if (pos > 0) {
+    line[pos] = '\0';
+    output.println(line);
   }
-  Serial.println();
+  output.println();
 }
 
-int CalendarDisplay::parseActivitiesFromJson(JsonArray activities, int* activityDays, int maxDays) {
-  int count = 0;
+uint32_t CalendarDisplay::parseActivitiesFromJson(JsonArray activities) {
+  uint32_t activityDays = 0;
   
   for (JsonObject activity : activities) {
-    if (count >= maxDays) break;
-    
-    // Extract the day from start_date (format: "YYYY-MM-DD" or ISO8601)
-    const char* startDate = activity["start_date"];
+    // Extract the day from activity_date (calendar rows) or start_date
+    // (activity rows); format: "YYYY-MM-DD" or ISO8601
+    const char* startDate = activity["activity_date"] | activity["start_date"].as<const char*>();
     
     if (startDate != nullptr && strlen(startDate) >= 10) {
       // Parse day from "YYYY-MM-DD" format (day is at position 8-9)
       int day = (startDate[8] - '0') * 10 + (startDate[9] - '0');
       
-      // Check if this day is already in the array
-      bool alreadyExists = false;
-      for (int i = 0; i < count; i++) {
-        if (activityDays[i] == day) {
-          alreadyExists = true;
-          break;
-        }
-      }
-      
-      if (!alreadyExists) {
-        activityDays[count] = day;
-        count++;
+      // Setting the bit again for a repeated day is a no-op
+      if (day >= 1 && day <= 31) {
+        activityDays |= 1UL << day;
       }
     }
   }
   
-  return count;
+  return activityDays;
 }
@@ -11,13 +11,12 @@ public:
   
   // Print a calendar for the given year and month
   // output: Print stream to write to (e.g., Serial)
-  // activityDays: array of day numbers (1-31) that have activities
-  // activityCount: number of days with activities
-  void printCalendar(Print& output, int year, int month, int* activityDays, int activityCount);
+  // activityDays: bitmask of days with activities (bit N set = day N)
+  void printCalendar(Print& output, int year, int month, uint32_t activityDays);
   
   // Parse JSON array of activities and extract days
-  // Returns number of active days found
-  int parseActivitiesFromJson(JsonArray activities, int* activityDays, int maxDays);
+  // Returns a bitmask of active days (bit N set = day N)
+  uint32_t parseActivitiesFromJson(JsonArray activities);
   
 private:
   // Get the number of days in a given month/year
@@ -29,9 +28,6 @@ private:
   // Check if a year is a leap year
   bool isLeapYear(int year);
   
-  // Check if a day has an activity
-  bool hasDayActivity(int day, int* activityDays, int activityCount);
-  
   // Get month name
   const char* getMonthName(int month);
 };
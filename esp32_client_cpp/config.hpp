@@ -5,23 +5,38 @@
 #ifndef CONFIG_H
 #define CONFIG_H
 
+// Constants are `const char* const` so the pointers themselves live in flash
+// alongside the string literals instead of taking RAM as mutable globals
+
 // WiFi Credentials
-const char* WIFI_SSID = "black_mesa";
-const char* WIFI_PASSWORD = "thecakeisalie!";
+const char* const WIFI_SSID = "black_mesa";
+const char* const WIFI_PASSWORD = "thecakeisalie!";
 
 // API Configuration
 #define ESP32_API_KEY "9f267ca3adb01e394f917902588fc920ae3669e1889f360f16bc1792768779e6"
 
-// Server Configuration - Base URL (no trailing slash)
+// Server Configuration - API base URL, including /api (no trailing slash)
 #define USE_PRODUCTION true
 
 #if USE_PRODUCTION
-const char* SERVER_BASE_URL = "https://matrix-miles-production.up.railway.app/api";
+const char* const SERVER_BASE_URL = "https://matrix-miles-production.up.railway.app/api";
 #else
-const char* SERVER_BASE_URL = "https://your-test-server.com";
+const char* const SERVER_BASE_URL = "https://your-test-server.com/api";
 #endif
 
 // User ID for API requests
 const int USER_ID = 1;
 
+// Light-sleep between fetches instead of idling (lower power; the serial
+// monitor disconnects while the board is asleep)
+#define USE_LIGHT_SLEEP false
+
+// Static IP - skips DHCP on every (re)connect; the client falls back to DHCP
+// if the network is unreachable with these settings
+#define USE_STATIC_IP false
+const IPAddress STATIC_IP(192, 168, 1, 200);
+const IPAddress STATIC_GATEWAY(192, 168, 1, 1);
+const IPAddress STATIC_SUBNET(255, 255, 255, 0);
+const IPAddress STATIC_DNS(192, 168, 1, 1);
+
 #endif // CONFIG_H
@@ -2,6 +2,9 @@
 #include <WiFi.h>
 #include <WiFiMulti.h>
 #include <HTTPClient.h>
+#include <WiFiClientSecure.h>
+#include <lwip/sockets.h>
+#include <esp_sleep.h>
 #include <ArduinoJson.h>  // Install via Library Manager if not present
 #include "config.hpp"     // Contains WiFi credentials and API keys
 #include "CalendarDisplay.h"
@@ -10,11 +13,78 @@
 
 // Timing
 const unsigned long FETCH_INTERVAL_MS = 10000;  // 10 seconds for testing
+const unsigned long INITIAL_RETRY_BACKOFF_MS = 1000;
 unsigned long lastFetchTime = 0;
+unsigned long nextFetchDelayMs = FETCH_INTERVAL_MS;
+unsigned long retryBackoffMs = INITIAL_RETRY_BACKOFF_MS;
+
+// Consecutive unreachable-network results on a static IP before falling back to DHCP
+const int STATIC_IP_MAX_FAILURES = 2;
+bool usingStaticIp = USE_STATIC_IP;
+int staticIpFailures = 0;
+
+// The three stats the display shows, copied out of the JSON document
+struct ActivityStats {
+  long totalActivities;
+  float totalDistance;  // meters
+  long totalTime;       // seconds
+};
+
+// Outcome of a fetch, used to pick the delay before the next one
+enum FetchResult {
+  FETCH_OK,             // Displayed fresh data
+  FETCH_NO_CONNECTION,  // Could not open a connection at all; retry with backoff
+  FETCH_NETWORK_ERROR,  // Connected but got no HTTP response (timeout, stale
+                        // socket); retry with backoff
+  FETCH_RETRY,          // Server reached but failed transiently (5xx/429,
+                        // truncated body); retry with backoff
+  FETCH_FAILED          // Won't fix itself on retry (4xx, bad JSON); wait a full interval
+};
+
+// TCP keep-alive on the pooled socket: first probe after 60 s idle, then
+// every 10 s, giving up after 3 unanswered probes
+const int KEEPALIVE_IDLE_S = 60;
+const int KEEPALIVE_INTERVAL_S = 10;
+const int KEEPALIVE_COUNT = 3;
+
+// Dashboard contents
+const int RECENT_ACTIVITY_LIMIT = 5;
 
 WiFiMulti wifiMulti;
 CalendarDisplay calendar;
 
+// Long-lived HTTP session: one TLS socket reused across fetches (keep-alive)
+WiFiClientSecure secureClient;
+HTTPClient http;
+
+// Dashboard request URL, rendered once in setup()
+String dashboardUrl;
+
+// Server hostname, used to probe DNS when deciding whether a static IP works
+String serverHost;
+
+// JSON pool and filter are allocated once and reused every fetch rather than
+// malloc'd and freed per cycle, which fragments the heap over time
+DynamicJsonDocument dashboardDoc(3072);
+StaticJsonDocument<384> dashboardFilter;
+
+// Start the WiFi driver in station mode; called at boot and after every
+// light-sleep wake-up, since the driver is stopped while asleep
+void configureWiFi() {
+  // Keep the radio awake; modem power-save adds wake-up latency to every
+  // request and makes HTTP errors more frequent
+  WiFi.mode(WIFI_STA);
+  WiFi.setSleep(false);
+
+#if USE_STATIC_IP
+  // Skip the DHCP exchange on every (re)connect, unless we already fell back
+  if (usingStaticIp && !WiFi.config(STATIC_IP, STATIC_GATEWAY, STATIC_SUBNET, STATIC_DNS)) {
+    USE_SERIAL.println("[WiFi] Static IP config failed, using DHCP");
+    usingStaticIp = false;
+  }
+#endif
+}
+
 void setup() {
   USE_SERIAL.begin(115200);
   USE_SERIAL.println();
@@ -29,71 +99,243 @@ void setup() {
     delay(1000);
   }
 
+  configureWiFi();
+
   // Add WiFi network
   wifiMulti.addAP(WIFI_SSID, WIFI_PASSWORD);
 
+  // Keep the TCP+TLS connection open between fetches instead of
+  // re-handshaking on every request
+  secureClient.setInsecure();
+  http.setReuse(true);
+  http.setTimeout(15000);  // 15 second timeout
+
+  // The request never changes between fetches, so build the URL once;
+  // stats, recent activities and the current calendar month come back in a
+  // single response (the server picks the month and echoes it back)
+  // Appending in place into one reserved buffer avoids String temporaries
+  dashboardUrl.reserve(128);
+  dashboardUrl += SERVER_BASE_URL;
+  dashboardUrl += "/dashboard/";
+  dashboardUrl += USER_ID;
+  dashboardUrl += "?limit=";
+  dashboardUrl += RECENT_ACTIVITY_LIMIT;
+
+  // "https://host[:port]/api" -> "host"
+  serverHost = SERVER_BASE_URL;
+  serverHost = serverHost.substring(serverHost.indexOf("://") + 3);
+  int hostEnd = serverHost.indexOf('/');
+  int portStart = serverHost.indexOf(':');
+  if (portStart >= 0 && (hostEnd < 0 || portStart < hostEnd)) {
+    hostEnd = portStart;
+  }
+  if (hostEnd >= 0) {
+    serverHost = serverHost.substring(0, hostEnd);
+  }
+
+  // Only materialize the fields the display reads
+  JsonObject statsFilter = dashboardFilter.createNestedObject("stats");
+  statsFilter["total_activities"] = true;
+  statsFilter["total_distance"] = true;
+  statsFilter["total_time"] = true;
+  JsonObject activityFilter = dashboardFilter["activities"].createNestedObject();
+  activityFilter["name"] = true;
+  activityFilter["type"] = true;
+  activityFilter["distance"] = true;
+  activityFilter["moving_time"] = true;
+  activityFilter["start_date"] = true;
+  dashboardFilter["calendar"][0]["activity_date"] = true;
+  dashboardFilter["year"] = true;
+  dashboardFilter["month"] = true;
+
   USE_SERIAL.println("[SETUP] Connecting to WiFi...");
 }
 
-void fetchActivities() {
-  HTTPClient http;
+// Enable TCP keep-alive probes so NAT/proxy idle timeouts don't silently
+// drop the pooled socket while we wait for the next fetch. lwIP's default
+// keep-idle is 2 hours, so probe well inside typical NAT timeouts instead.
+void enableSocketKeepAlive() {
+  int enable = 1;
+  int idleSeconds = KEEPALIVE_IDLE_S;
+  int intervalSeconds = KEEPALIVE_INTERVAL_S;
+  int probeCount = KEEPALIVE_COUNT;
+  secureClient.setSocketOption(SOL_SOCKET, SO_KEEPALIVE, &enable, sizeof(enable));
+  secureClient.setSocketOption(IPPROTO_TCP, TCP_KEEPIDLE, &idleSeconds, sizeof(idleSeconds));
+  secureClient.setSocketOption(IPPROTO_TCP, TCP_KEEPINTVL, &intervalSeconds, sizeof(intervalSeconds));
+  secureClient.setSocketOption(IPPROTO_TCP, TCP_KEEPCNT, &probeCount, sizeof(probeCount));
+}
 
-  USE_SERIAL.println("\n[HTTP] Fetching recent activities...");
+// Deserialize the response body, keeping only the fields selected by filter.
+// The server sends a Content-Length so the body is parsed straight off the
+// socket; a chunked response (e.g. re-chunked by a proxy) has to be buffered
+// so HTTPClient can de-chunk it, which costs a full copy of the body on the heap.
+DeserializationError readJsonResponse(JsonDocument& doc, JsonDocument& filter) {
+  if (http.getSize() > 0) {
+    return deserializeJson(doc, http.getStream(), DeserializationOption::Filter(filter));
+  }
 
-  // Build the full URL
-  String url = String(SERVER_BASE_URL) + "/activities/calendar/1/2025/11";
-  // String url = String(SERVER_BASE_URL) + "/stats/" + String(USER_ID);
+  USE_SERIAL.println("[HTTP] No Content-Length, buffering chunked body before parsing");
+  String body = http.getString();
+  USE_SERIAL.printf("[HTTP] Buffered %u bytes\n", body.length());
+  return deserializeJson(doc, body, DeserializationOption::Filter(filter));
+}
+
+ActivityStats parseStats(JsonObject stats) {
+  return ActivityStats{
+    stats["total_activities"] | 0L,
+    stats["total_distance"] | 0.0f,
+    stats["total_time"] | 0L,
+  };
+}
+
+void displayStats(const ActivityStats& stats) {
+  USE_SERIAL.println("\n========== STATS ==========");
+  USE_SERIAL.printf("Activities: %ld\n", stats.totalActivities);
+  USE_SERIAL.printf("Distance:   %.2f km\n", stats.totalDistance / 1000.0f);
+  USE_SERIAL.printf("Time:       %ldh %02ldm\n", stats.totalTime / 3600, (stats.totalTime % 3600) / 60);
+}
+
+void displayActivities(JsonArray activities) {
+  USE_SERIAL.println("\n===== RECENT ACTIVITIES =====");
+  for (JsonObject activity : activities) {
+    const char* name = activity["name"] | "Unknown";
+    const char* type = activity["type"] | "Unknown";
+    const char* startDate = activity["start_date"] | "";
+    float distance = activity["distance"] | 0.0f;
+    long movingTime = activity["moving_time"] | 0L;
+
+    USE_SERIAL.printf("%.10s  %-8s %6.2f km  %ld:%02ld  %s\n",
+                      startDate, type, distance / 1000.0f,
+                      movingTime / 60, movingTime % 60, name);
+  }
+}
+
+FetchResult fetchDashboard() {
+  FetchResult result = FETCH_OK;
+
+  USE_SERIAL.println("\n[HTTP] Fetching dashboard...");
 
   // Configure HTTP client
-  http.begin(url);
+  http.begin(secureClient, dashboardUrl);
   http.addHeader("X-API-Key", ESP32_API_KEY);
-  http.setTimeout(15000);  // 15 second timeout
 
-  USE_SERIAL.printf("[HTTP] GET %s\n", url.c_str());
+  USE_SERIAL.printf("[HTTP] GET %s\n", dashboardUrl.c_str());
+
+  // A closed session means GET() opens a fresh socket that needs keep-alive
+  bool newConnection = !http.connected();
 
   // Send GET request
   int httpCode = http.GET();
 
   if (httpCode > 0) {
+    if (newConnection) {
+      enableSocketKeepAlive();
+    }
     USE_SERIAL.printf("[HTTP] Response code: %d\n", httpCode);
 
     if (httpCode == HTTP_CODE_OK) {
-      String payload = http.getString();
+      // deserializeJson() clears the reused document before parsing
+      DeserializationError error = readJsonResponse(dashboardDoc, dashboardFilter);
 
-      USE_SERIAL.println("\n========== ACTIVITIES JSON ==========");
-      USE_SERIAL.println(payload);
-      USE_SERIAL.println("=====================================\n");
+      if (!error) {
+        USE_SERIAL.printf("BYTE SIZE: %d\n", dashboardDoc.memoryUsage());
 
-      // Parse JSON for calendar display
-      DynamicJsonDocument doc(8192);
-      DeserializationError error = deserializeJson(doc, payload);
+        displayStats(parseStats(dashboardDoc["stats"]));
+        displayActivities(dashboardDoc["activities"]);
 
-      if (!error) {
-        JsonArray activities = doc.as<JsonArray>();
-        USE_SERIAL.printf("Found %d activities:\n", activities.size());
-        USE_SERIAL.printf("BYTE SIZE: %d\n\n", doc.memoryUsage());
-        
         // Parse activity days and display calendar
-        int activityDays[31];  // Max 31 days in a month
-        int activityCount = calendar.parseActivitiesFromJson(activities, activityDays, 31);
+        uint32_t activityDays = calendar.parseActivitiesFromJson(dashboardDoc["calendar"]);
         
-        USE_SERIAL.printf("Activities on %d days\n", activityCount);
+        USE_SERIAL.printf("\nActivities on %d days\n", __builtin_popcount(activityDays));
         
         // Display the calendar
-        calendar.printCalendar(2025, 11, activityDays, activityCount);
+        calendar.printCalendar(USE_SERIAL, dashboardDoc["year"].as<int>(),
+                               dashboardDoc["month"].as<int>(), activityDays);
         
       } else {
         USE_SERIAL.printf("[JSON] Parse error: %s\n", error.c_str());
+        // A body cut off mid-read is a network problem, not a bad payload
+        result = (error == DeserializationError::IncompleteInput) ? FETCH_RETRY : FETCH_FAILED;
       }
 
     } else {
       USE_SERIAL.printf("[HTTP] Non-OK status code: %d\n", httpCode);
+      bool transient = httpCode >= 500 || httpCode == HTTP_CODE_TOO_MANY_REQUESTS;
+      result = transient ? FETCH_RETRY : FETCH_FAILED;
     }
   } else {
     USE_SERIAL.printf("[HTTP] GET failed, error: %s\n", http.errorToString(httpCode).c_str());
+    result = (httpCode == HTTPC_ERROR_CONNECTION_REFUSED) ? FETCH_NO_CONNECTION : FETCH_NETWORK_ERROR;
   }
 
+  // Returns the socket to the session instead of closing it
   http.end();
+
+  return result;
+}
+
+// Schedule the next fetch: the regular interval after success or a permanent
+// failure, otherwise exponential backoff with jitter capped at the interval
+void scheduleNextFetch(FetchResult result) {
+  if (result != FETCH_RETRY && result != FETCH_NETWORK_ERROR && result != FETCH_NO_CONNECTION) {
+    nextFetchDelayMs = FETCH_INTERVAL_MS;
+    retryBackoffMs = INITIAL_RETRY_BACKOFF_MS;
+    return;
+  }
+
+  nextFetchDelayMs = min(retryBackoffMs, FETCH_INTERVAL_MS) + random(1000);
+  if (retryBackoffMs < FETCH_INTERVAL_MS) {
+    retryBackoffMs *= 2;
+  }
+}
+
+// A static IP that doesn't fit the network still associates but can't reach
+// anything, so when connections repeatedly fail and DNS can't resolve the
+// server either, switch back to DHCP and reconnect. Any HTTP response, even
+// a 5xx, proves the address works; timeouts or send failures on an open
+// socket say nothing about it either way.
+void checkStaticIp(FetchResult result) {
+  if (!usingStaticIp || result == FETCH_NETWORK_ERROR) {
+    return;
+  }
+
+  // A failed connect with working DNS means the server is down, not us
+  IPAddress resolved;
+  if (result != FETCH_NO_CONNECTION || WiFi.hostByName(serverHost.c_str(), resolved)) {
+    staticIpFailures = 0;
+    return;
+  }
+
+  if (++staticIpFailures >= STATIC_IP_MAX_FAILURES) {
+    USE_SERIAL.println("[WiFi] Static IP unreachable, falling back to DHCP");
+    // The pooled socket is bound to the static address; close it so the
+    // first fetch after the DHCP reconnect opens a fresh one
+    secureClient.stop();
+    WiFi.config(INADDR_NONE, INADDR_NONE, INADDR_NONE);
+    WiFi.disconnect();
+    usingStaticIp = false;
+  }
+}
+
+// Light-sleep until the next fetch is due. The radio is powered down while
+// asleep, so close the pooled socket and stop the WiFi driver first (ESP-IDF
+// requires esp_wifi_stop() before manual light sleep); after wake-up the
+// driver is restarted and wifiMulti.run() reconnects.
+void sleepUntilNextFetch() {
+  unsigned long elapsed = millis() - lastFetchTime;
+  if (elapsed >= nextFetchDelayMs) {
+    return;
+  }
+
+  secureClient.stop();
+  WiFi.disconnect();
+  WiFi.mode(WIFI_OFF);
+  USE_SERIAL.flush();
+
+  esp_sleep_enable_timer_wakeup((uint64_t)(nextFetchDelayMs - elapsed) * 1000ULL);
+  esp_light_sleep_start();
+
+  configureWiFi();
 }
 
 void loop() {
@@ -101,18 +343,24 @@ void loop() {
   if (wifiMulti.run() == WL_CONNECTED) {
     unsigned long currentTime = millis();
 
-    // Fetch on first run or after interval
-    if (lastFetchTime == 0 || (currentTime - lastFetchTime >= FETCH_INTERVAL_MS)) {
-      fetchActivities();
+    // Fetch on first run or once the scheduled delay has passed
+    if (lastFetchTime == 0 || (currentTime - lastFetchTime >= nextFetchDelayMs)) {
+      FetchResult result = fetchDashboard();
+      scheduleNextFetch(result);
+      checkStaticIp(result);
       lastFetchTime = currentTime;
 
-      unsigned long nextFetch = FETCH_INTERVAL_MS / 1000;
+      unsigned long nextFetch = nextFetchDelayMs / 1000;
       USE_SERIAL.printf("[INFO] Next fetch in %lu seconds\n\n",
                         nextFetch);
     }
 
+#if USE_LIGHT_SLEEP
+    sleepUntilNextFetch();
+#else
     // Small delay to prevent busy-waiting
     delay(1000);
+#endif
 
   } else {
     USE_SERIAL.println("[WiFi] Not connected, waiting...");
@@ -104,6 +104,7 @@ func main() {
 	api.GET("/activities/recent/:userId", apiHandler.GetRecentActivities)
 	api.GET("/activities/calendar/:userId/:year/:month", apiHandler.GetCalendarData)
 	api.GET("/stats/:userId", apiHandler.GetUserStats)
+	api.GET("/dashboard/:userId", apiHandler.GetDashboard)
 
 	// Admin routes (protected with basic auth)
 	admin := e.Group("/admin")
@@ -3,6 +3,7 @@ package handlers
 import (
 	"context"
 	"database/sql"
+	"encoding/json"
 	"net/http"
 	"strconv"
 	"time"
@@ -13,6 +14,9 @@ import (
 	"github.com/mckusa/strava-server/internal/strava"
 )
 
+// maxRecentActivities caps the ?limit= query parameter on activity endpoints
+const maxRecentActivities = 100
+
 type APIHandler struct {
 	queries      *database.Queries
 	stravaClient *strava.Client
@@ -32,10 +36,15 @@ func (h *APIHandler) GetRecentActivities(c echo.Context) error {
 		return echo.NewHTTPError(http.StatusBadRequest, "Invalid user ID")
 	}
 
+	limit, err := parseLimit(c, 10)
+	if err != nil {
+		return err
+	}
+
 	ctx := context.Background()
 	activities, err := h.queries.GetRecentActivities(ctx, database.GetRecentActivitiesParams{
 		UserID: int32(userID),
-		Limit:  10,
+		Limit:  int32(limit),
 	})
 
 	if err != nil {
@@ -62,16 +71,8 @@ func (h *APIHandler) GetCalendarData(c echo.Context) error {
 		return echo.NewHTTPError(http.StatusBadRequest, "Invalid month")
 	}
 
-	// Calculate date range
-	firstDay := time.Date(year, time.Month(month), 1, 0, 0, 0, 0, time.UTC)
-	lastDay := firstDay.AddDate(0, 1, -1).Add(23*time.Hour + 59*time.Minute + 59*time.Second)
-
 	ctx := context.Background()
-	calendarData, err := h.queries.GetCalendarData(ctx, database.GetCalendarDataParams{
-		UserID:      int32(userID),
-		StartDate:   pgtype.Timestamp{Time: firstDay, Valid: true},
-		StartDate_2: pgtype.Timestamp{Time: lastDay, Valid: true},
-	})
+	calendarData, err := h.getCalendarData(ctx, userID, year, month)
 
 	if err != nil {
 		return echo.NewHTTPError(http.StatusInternalServerError, err.Error())
@@ -97,6 +98,101 @@ func (h *APIHandler) GetUserStats(c echo.Context) error {
 	return c.JSON(http.StatusOK, stats)
 }
 
+// GetDashboard returns stats, recent activities and calendar data for a user
+// in a single response so the ESP32 only needs one request per refresh
+func (h *APIHandler) GetDashboard(c echo.Context) error {
+	userID, err := strconv.Atoi(c.Param("userId"))
+	if err != nil {
+		return echo.NewHTTPError(http.StatusBadRequest, "Invalid user ID")
+	}
+
+	limit, err := parseLimit(c, 5)
+	if err != nil {
+		return err
+	}
+
+	// Calendar month defaults to the current month
+	now := time.Now().UTC()
+	year, month := now.Year(), int(now.Month())
+
+	if queryYear := c.QueryParam("year"); queryYear != "" {
+		year, err = strconv.Atoi(queryYear)
+		if err != nil {
+			return echo.NewHTTPError(http.StatusBadRequest, "Invalid year")
+		}
+	}
+
+	if queryMonth := c.QueryParam("month"); queryMonth != "" {
+		month, err = strconv.Atoi(queryMonth)
+		if err != nil || month < 1 || month > 12 {
+			return echo.NewHTTPError(http.StatusBadRequest, "Invalid month")
+		}
+	}
+
+	ctx := context.Background()
+	stats, err := h.queries.GetActivityStats(ctx, int32(userID))
+	if err != nil {
+		return echo.NewHTTPError(http.StatusInternalServerError, err.Error())
+	}
+
+	activities, err := h.queries.GetRecentActivities(ctx, database.GetRecentActivitiesParams{
+		UserID: int32(userID),
+		Limit:  int32(limit),
+	})
+	if err != nil {
+		return echo.NewHTTPError(http.StatusInternalServerError, err.Error())
+	}
+
+	calendarData, err := h.getCalendarData(ctx, userID, year, month)
+	if err != nil {
+		return echo.NewHTTPError(http.StatusInternalServerError, err.Error())
+	}
+
+	body, err := json.Marshal(map[string]any{
+		"stats":      stats,
+		"activities": activities,
+		"calendar":   calendarData,
+		"year":       year,
+		"month":      month,
+	})
+	if err != nil {
+		return echo.NewHTTPError(http.StatusInternalServerError, err.Error())
+	}
+
+	// The body is larger than net/http's chunking buffer; an explicit
+	// Content-Length keeps it unchunked so the ESP32 can parse it off the socket
+	c.Response().Header().Set(echo.HeaderContentLength, strconv.Itoa(len(body)))
+	return c.JSONBlob(http.StatusOK, body)
+}
+
+// getCalendarData returns per-day activity totals for a calendar month
+func (h *APIHandler) getCalendarData(ctx context.Context, userID, year, month int) ([]database.GetCalendarDataRow, error) {
+	// Calculate date range
+	firstDay := time.Date(year, time.Month(month), 1, 0, 0, 0, 0, time.UTC)
+	lastDay := firstDay.AddDate(0, 1, -1).Add(23*time.Hour + 59*time.Minute + 59*time.Second)
+
+	return h.queries.GetCalendarData(ctx, database.GetCalendarDataParams{
+		UserID:      int32(userID),
+		StartDate:   pgtype.Timestamp{Time: firstDay, Valid: true},
+		StartDate_2: pgtype.Timestamp{Time: lastDay, Valid: true},
+	})
+}
+
+// parseLimit reads the optional ?limit= query parameter, bounded by maxRecentActivities
+func parseLimit(c echo.Context, fallback int) (int, error) {
+	limitStr := c.QueryParam("limit")
+	if limitStr == "" {
+		return fallback, nil
+	}
+
+	limit, err := strconv.Atoi(limitStr)
+	if err != nil || limit < 1 || limit > maxRecentActivities {
+		return 0, echo.NewHTTPError(http.StatusBadRequest, "Invalid limit parameter")
+	}
+
+	return limit, nil
+}
+
 // SyncActivities fetches and stores activities from Strava
 func (h *APIHandler) SyncActivities(c echo.Context) error {
 	userID, err := strconv.Atoi(c.Param("userId"))
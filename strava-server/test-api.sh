@@ -57,7 +57,7 @@ echo ""
 
 # 3. Get Recent Activities (Protected - requires API key)
 echo -e "${YELLOW}Note: Replace 'USER_ID' with actual user ID from your database${NC}"
-test_endpoint "Get Recent Activities (requires API key)" "GET" "/api/activities/recent/1" \
+test_endpoint "Get Recent Activities (requires API key)" "GET" "/api/activities/recent/1?limit=5" \
     -H "X-API-Key: ${API_KEY}"
 
 # 4. Get Calendar Data (Protected - requires API key)
@@ -68,19 +68,23 @@ test_endpoint "Get Calendar Data (requires API key)" "GET" "/api/activities/cale
 test_endpoint "Get User Stats (requires API key)" "GET" "/api/stats/1" \
     -H "X-API-Key: ${API_KEY}"
 
-# 6. Sync Activities (Admin - requires basic auth)
+# 6. Get Dashboard (Protected - requires API key)
+test_endpoint "Get Dashboard (requires API key)" "GET" "/api/dashboard/1?limit=5&year=2024&month=11" \
+    -H "X-API-Key: ${API_KEY}"
+
+# 7. Sync Activities (Admin - requires basic auth)
 test_endpoint "Sync Activities (admin)" "POST" "/admin/sync/1" \
     -u "${ADMIN_USER}:${ADMIN_PASS}"
 
-# 7. View Recent Logs (Admin)
+# 8. View Recent Logs (Admin)
 test_endpoint "Get Recent Logs (admin)" "GET" "/admin/logs" \
     -u "${ADMIN_USER}:${ADMIN_PASS}"
 
-# 8. View Logs by Level (Admin)
+# 9. View Logs by Level (Admin)
 test_endpoint "Get Error Logs (admin)" "GET" "/admin/logs/level/error" \
     -u "${ADMIN_USER}:${ADMIN_PASS}"
 
-# 9. View Logs by User (Admin)
+# 10. View Logs by User (Admin)
 test_endpoint "Get User Logs (admin)" "GET" "/admin/logs/user/1" \
     -u "${ADMIN_USER}:${ADMIN_PASS}"
 
@@ -93,9 +97,10 @@ echo "  - GET  /auth/login"
 echo "  - GET  /auth/callback"
 echo ""
 echo "API endpoints (X-API-Key header required):"
-echo "  - GET  /api/activities/recent/:userId"
+echo "  - GET  /api/activities/recent/:userId?limit=N"
 echo "  - GET  /api/activities/calendar/:userId/:year/:month"
 echo "  - GET  /api/stats/:userId"
+echo "  - GET  /api/dashboard/:userId?limit=N&year=YYYY&month=MM"
 echo ""
 echo "Admin endpoints (Basic Auth required):"
 echo "  - POST /admin/sync/:userId"